@@ -0,0 +1,30 @@
+"""Add per-retailer, per-day SKU counters
+
+Revision ID: 20261015_0002
+Revises: 20251105_0001
+Create Date: 2026-10-15 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261015_0002"
+down_revision = "20251105_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sku_counters",
+        sa.Column("retailer_id", sa.Integer(), sa.ForeignKey("retailers.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("date_part", sa.String(length=8), nullable=False),
+        sa.Column("last_sequence", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("retailer_id", "date_part"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("sku_counters")
@@ -0,0 +1,23 @@
+"""Index gift cards by retailer and SKU
+
+Revision ID: 20261015_0003
+Revises: 20261015_0002
+Create Date: 2026-10-15 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20261015_0003"
+down_revision = "20261015_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_giftcards_retailer_sku", "gift_cards", ["retailer_id", "sku"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_giftcards_retailer_sku", table_name="gift_cards")
@@ -1,6 +1,6 @@
 """Core infrastructure utilities."""
 
-from .db import engine, init_db, session_scope
+from .db import SessionFactory, engine, init_db, session_scope
 from .settings import settings
 
-__all__ = ["engine", "init_db", "session_scope", "settings"]
+__all__ = ["SessionFactory", "engine", "init_db", "session_scope", "settings"]
@@ -0,0 +1,42 @@
+"""Value conversions shared by the CSV import/export modules."""
+
+from __future__ import annotations
+
+import logging
+from decimal import Decimal
+
+logger = logging.getLogger(__name__)
+
+
+def normalise_code(retailer_code: str) -> str:
+    """Return ``retailer_code`` stripped and upper-cased; reject empty codes."""
+
+    code = retailer_code.strip().upper()
+    if not code:
+        raise ValueError("Retailer code must not be empty")
+    return code
+
+
+def parse_decimal(value: str | None) -> Decimal | None:
+    """Parse a CSV cell as a ``Decimal``; blank or malformed cells give ``None``."""
+
+    if value is None:
+        return None
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return Decimal(value)
+    except ArithmeticError:
+        logger.warning("Could not parse decimal from value '%s'", value)
+        return None
+
+
+def decimal_to_str(value: Decimal | float | int | None) -> str:
+    """Format an amount for CSV output without exponent notation."""
+
+    if value is None:
+        return ""
+    if isinstance(value, Decimal):
+        return format(value, "f")
+    return str(value)
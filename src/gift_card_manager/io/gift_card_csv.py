@@ -19,6 +19,7 @@ from typing import Iterable, List, Sequence
 from sqlalchemy.orm import Session
 
 from ..models import GiftCard, Retailer
+from .csv_utils import decimal_to_str, normalise_code, parse_decimal
 
 logger = logging.getLogger(__name__)
 
@@ -73,15 +74,8 @@ GIFT_CARD_FORMATS: dict[str, GiftCardCSVFormat] = {
 }
 
 
-def _normalise_code(retailer_code: str) -> str:
-    code = retailer_code.strip().upper()
-    if not code:
-        raise ValueError("Retailer code must not be empty")
-    return code
-
-
 def _get_retailer(session: Session, retailer_code: str) -> Retailer:
-    code = _normalise_code(retailer_code)
+    code = normalise_code(retailer_code)
     retailer = session.query(Retailer).filter(Retailer.code == code).one_or_none()
     if retailer is None:
         raise ValueError(f"Retailer with code '{code}' not found in database")
@@ -89,7 +83,7 @@ def _get_retailer(session: Session, retailer_code: str) -> Retailer:
 
 
 def _get_format(retailer_code: str) -> GiftCardCSVFormat:
-    code = _normalise_code(retailer_code)
+    code = normalise_code(retailer_code)
     try:
         return GIFT_CARD_FORMATS[code]
     except KeyError as exc:
@@ -141,9 +135,9 @@ def import_gift_cards_from_csv(
                 retailer_code=retailer.code,
                 card_number=card_number,
                 pin=pin_value or None,
-                acquisition_cost=_parse_decimal(record.get("acquisition_cost")),
-                face_value=_parse_decimal(record.get("face_value")),
-                remaining_balance=_parse_decimal(record.get("remaining_balance")),
+                acquisition_cost=parse_decimal(record.get("acquisition_cost")),
+                face_value=parse_decimal(record.get("face_value")),
+                remaining_balance=parse_decimal(record.get("remaining_balance")),
             )
             rows.append(row)
 
@@ -184,9 +178,9 @@ def export_gift_cards_to_csv(
             row = {
                 "card_number": card.card_number,
                 "pin": card.card_pin or "",
-                "acquisition_cost": _decimal_to_str(card.acquisition_cost),
-                "face_value": _decimal_to_str(card.face_value),
-                "remaining_balance": _decimal_to_str(card.remaining_balance),
+                "acquisition_cost": decimal_to_str(card.acquisition_cost),
+                "face_value": decimal_to_str(card.face_value),
+                "remaining_balance": decimal_to_str(card.remaining_balance),
             }
 
             if not fmt.requires_pin:
@@ -195,24 +189,3 @@ def export_gift_cards_to_csv(
             writer.writerow(row)
 
     logger.info("Export completed for retailer %s", retailer.code)
-
-
-def _parse_decimal(value: str | None) -> Decimal | None:
-    if value is None:
-        return None
-    value = value.strip()
-    if not value:
-        return None
-    try:
-        return Decimal(value)
-    except ArithmeticError:
-        logger.warning("Could not parse decimal from value '%s'", value)
-        return None
-
-
-def _decimal_to_str(value: Decimal | float | int | None) -> str:
-    if value is None:
-        return ""
-    if isinstance(value, Decimal):
-        return format(value, "f")
-    return str(value)
\ No newline at end of file
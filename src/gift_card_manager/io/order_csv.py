@@ -0,0 +1,201 @@
+"""CSV import/export utilities for orders.
+
+Both directions stream: the export writes rows as the database cursor yields
+them, and the import inserts parsed rows in fixed-size batches, so memory use
+stays flat regardless of file size.
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from ..models import Order, Retailer
+from ..models.enums import OrderStatus, PaymentMethod
+from .csv_utils import decimal_to_str, normalise_code, parse_decimal
+
+logger = logging.getLogger(__name__)
+
+ORDER_CSV_COLUMNS: tuple[str, ...] = (
+    "retailer_code",
+    "order_number",
+    "order_date",
+    "order_email",
+    "payment_method",
+    "status",
+    "subtotal",
+    "tax",
+    "shipping",
+    "total_cost",
+    "credit_card_spend",
+    "gift_card_spend",
+)
+
+_REQUIRED_COLUMNS = {"retailer_code", "order_number", "order_date", "payment_method", "total_cost"}
+
+EXPORT_YIELD_PER = 1000
+IMPORT_BATCH_SIZE = 500
+
+_ZERO = Decimal("0")
+
+
+def export_orders_to_csv(
+    path: Path,
+    session: Session,
+    retailer_code: str | None = None,
+) -> int:
+    """Write orders to ``path``, optionally limited to one retailer.
+
+    Returns the number of orders written.
+    """
+
+    stmt = (
+        select(
+            Retailer.code,
+            Order.order_number,
+            Order.order_date,
+            Order.order_email,
+            Order.payment_method,
+            Order.status,
+            Order.subtotal,
+            Order.tax,
+            Order.shipping,
+            Order.total_cost,
+            Order.credit_card_spend,
+            Order.gift_card_spend,
+        )
+        .join(Retailer, Order.retailer_id == Retailer.id)
+        .order_by(Order.order_date, Order.id)
+        .execution_options(yield_per=EXPORT_YIELD_PER)
+    )
+    if retailer_code is not None:
+        stmt = stmt.where(Retailer.code == normalise_code(retailer_code))
+
+    logger.info("Exporting orders to %s", path)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    count = 0
+    with path.open("w", encoding="utf-8", newline="") as stream:
+        writer = csv.writer(stream)
+        writer.writerow(ORDER_CSV_COLUMNS)
+
+        for (
+            code,
+            order_number,
+            order_date,
+            order_email,
+            payment_method,
+            status,
+            *amounts,
+        ) in session.execute(stmt):
+            writer.writerow(
+                [
+                    code,
+                    order_number,
+                    order_date.isoformat() if order_date else "",
+                    order_email or "",
+                    payment_method.value,
+                    status.value,
+                    *(decimal_to_str(amount) for amount in amounts),
+                ]
+            )
+            count += 1
+
+    logger.info("Exported %s orders", count)
+    return count
+
+
+def import_orders_from_csv(path: Path, session: Session) -> int:
+    """Insert the orders described in ``path`` and return how many were added.
+
+    Rows with an unknown retailer, unparseable date/enum values or a missing
+    total are skipped with a warning. The caller owns the transaction.
+    """
+
+    if not path.exists():
+        raise FileNotFoundError(path)
+
+    retailer_ids = dict(session.execute(select(Retailer.code, Retailer.id)).all())
+
+    logger.info("Importing orders from %s", path)
+
+    count = 0
+    batch: List[Dict[str, Any]] = []
+    with path.open("r", encoding="utf-8-sig", newline="") as stream:
+        reader = csv.DictReader(stream)
+        missing = _REQUIRED_COLUMNS - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(
+                f"CSV file {path} is missing required columns: {', '.join(sorted(missing))}"
+            )
+
+        for idx, record in enumerate(reader, start=1):
+            values = _parse_order_record(idx, record, retailer_ids)
+            if values is None:
+                continue
+            batch.append(values)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                session.execute(insert(Order), batch)
+                count += len(batch)
+                batch = []
+
+    if batch:
+        session.execute(insert(Order), batch)
+        count += len(batch)
+
+    logger.info("Imported %s orders", count)
+    return count
+
+
+def _parse_order_record(
+    idx: int,
+    record: Dict[str, str | None],
+    retailer_ids: Dict[str, int],
+) -> Dict[str, Any] | None:
+    code = (record.get("retailer_code") or "").strip().upper()
+    retailer_id = retailer_ids.get(code)
+    if retailer_id is None:
+        logger.warning("Row %s skipped: unknown retailer '%s'", idx, code)
+        return None
+
+    order_number = (record.get("order_number") or "").strip()
+    if not order_number:
+        logger.warning("Row %s skipped: missing order_number", idx)
+        return None
+
+    try:
+        order_date = date.fromisoformat((record.get("order_date") or "").strip())
+        payment_method = PaymentMethod((record.get("payment_method") or "").strip().lower())
+        status_value = (record.get("status") or "").strip().lower()
+        status = OrderStatus(status_value) if status_value else OrderStatus.ORDERED
+    except ValueError as exc:
+        logger.warning("Row %s skipped: %s", idx, exc)
+        return None
+
+    total_cost = parse_decimal(record.get("total_cost"))
+    if total_cost is None:
+        logger.warning("Row %s skipped: missing total_cost", idx)
+        return None
+
+    return {
+        "retailer_id": retailer_id,
+        "order_number": order_number,
+        "order_date": order_date,
+        "order_email": (record.get("order_email") or "").strip() or None,
+        "payment_method": payment_method,
+        "status": status,
+        "subtotal": parse_decimal(record.get("subtotal")) or _ZERO,
+        "tax": parse_decimal(record.get("tax")) or _ZERO,
+        "shipping": parse_decimal(record.get("shipping")) or _ZERO,
+        "total_cost": total_cost,
+        "credit_card_spend": parse_decimal(record.get("credit_card_spend")) or _ZERO,
+        "gift_card_spend": parse_decimal(record.get("gift_card_spend")) or _ZERO,
+    }
@@ -1,7 +1,7 @@
 """Expose ORM models for convenient imports."""
 
 from .account import Account, AccountTransaction
-from .gift_card import GiftCard, GiftCardUsage
+from .gift_card import GiftCard, GiftCardUsage, SkuCounter
 from .inventory import InventoryItem, InventoryMovement
 from .order import Attachment, Order, OrderItem
 from .retailer import Retailer
@@ -20,4 +20,5 @@ __all__ = [
     "Retailer",
     "Sale",
     "SaleItem",
+    "SkuCounter",
 ]
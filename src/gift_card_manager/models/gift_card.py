@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import date
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Date, Enum, ForeignKey, Numeric, String
+from sqlalchemy import Date, Enum, ForeignKey, Index, Integer, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -21,6 +21,7 @@ class GiftCard(TimestampMixin, Base):
     """Represents a single gift card and its current balance."""
 
     __tablename__ = "gift_cards"
+    __table_args__ = (Index("ix_giftcards_retailer_sku", "retailer_id", "sku"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     retailer_id: Mapped[int] = mapped_column(
@@ -48,6 +49,18 @@ class GiftCard(TimestampMixin, Base):
     )
 
 
+class SkuCounter(Base):
+    """Last SKU sequence number issued per retailer and calendar day."""
+
+    __tablename__ = "sku_counters"
+
+    retailer_id: Mapped[int] = mapped_column(
+        ForeignKey("retailers.id", ondelete="CASCADE"), primary_key=True
+    )
+    date_part: Mapped[str] = mapped_column(String(8), primary_key=True)
+    last_sequence: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
 class GiftCardUsage(TimestampMixin, Base):
     """Logs deductions against a gift card."""
 
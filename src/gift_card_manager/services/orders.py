@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 from typing import Sequence
 
+from sqlalchemy import delete, select, update
 from sqlalchemy.orm import Session
 
-from ..models import GiftCard, GiftCardUsage, Order
+from ..models import Attachment, GiftCard, GiftCardUsage, InventoryMovement, Order, OrderItem
 from ..models.enums import GiftCardStatus
 
 
@@ -51,6 +53,54 @@ class OrderService:
         self.session.flush()
         self.session.delete(order)
 
+    def delete_orders(self, order_ids: Sequence[int]) -> None:
+        """Delete several orders at once and restore their gift card balances.
+
+        Mirrors :meth:`delete_order` with a fixed number of set-based statements
+        instead of loading and deleting each order individually.
+        """
+
+        ids = list(order_ids)
+        if not ids:
+            return
+
+        restored: dict[int, Decimal] = defaultdict(Decimal)
+        usages = self.session.execute(
+            select(GiftCardUsage.gift_card_id, GiftCardUsage.amount_used).where(
+                GiftCardUsage.order_id.in_(ids)
+            )
+        )
+        for gift_card_id, amount_used in usages:
+            restored[gift_card_id] += Decimal(amount_used)
+
+        if restored:
+            cards = self.session.scalars(select(GiftCard).where(GiftCard.id.in_(restored)))
+            for card in cards:
+                self._restore_balance(card, restored[card.id])
+            self.session.flush()
+
+        # Same end state as the ORM cascades on Order: usages and inventory
+        # movements are detached, items and attachments are removed.
+        bulk = {"synchronize_session": False}
+        item_ids = select(OrderItem.id).where(OrderItem.order_id.in_(ids))
+        self.session.execute(
+            update(InventoryMovement)
+            .where(InventoryMovement.order_item_id.in_(item_ids))
+            .values(order_item_id=None),
+            execution_options=bulk,
+        )
+        self.session.execute(
+            update(GiftCardUsage).where(GiftCardUsage.order_id.in_(ids)).values(order_id=None),
+            execution_options=bulk,
+        )
+        self.session.execute(
+            delete(OrderItem).where(OrderItem.order_id.in_(ids)), execution_options=bulk
+        )
+        self.session.execute(
+            delete(Attachment).where(Attachment.order_id.in_(ids)), execution_options=bulk
+        )
+        self.session.execute(delete(Order).where(Order.id.in_(ids)), execution_options=bulk)
+
     # ---------------------------------------------------- Gift card usage --
     def update_gift_card_allocations(
         self,
@@ -110,10 +160,7 @@ class OrderService:
                 card = self.session.get(GiftCard, usage.gift_card_id)
             if card is None:
                 continue
-            if card.remaining_balance is None:
-                card.remaining_balance = Decimal("0")
-            card.remaining_balance += Decimal(usage.amount_used)
-            self._apply_status(card)
+            self._restore_balance(card, usage.amount_used)
 
     # ------------------------------------------------------------- Helpers --
     def _get_gift_card(self, gift_card_id: int) -> GiftCard:
@@ -131,6 +178,15 @@ class OrderService:
             raise ValueError("Gift card allocation amount must be positive")
         return amount
 
+    @classmethod
+    def _restore_balance(cls, card: GiftCard, amount: Decimal) -> None:
+        """Credit ``amount`` back to ``card`` and update its status."""
+
+        if card.remaining_balance is None:
+            card.remaining_balance = Decimal("0")
+        card.remaining_balance += Decimal(amount)
+        cls._apply_status(card)
+
     @staticmethod
     def _apply_status(card: GiftCard) -> None:
         if card.remaining_balance is None or card.remaining_balance == 0:
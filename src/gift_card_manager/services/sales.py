@@ -7,7 +7,8 @@ from datetime import date
 from decimal import Decimal
 from typing import Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, func, lambda_stmt, or_, select
+from sqlalchemy.orm import Session, selectinload
 
 from ..models import InventoryItem, Sale, SaleItem
 from ..models.enums import InventorySourceType
@@ -29,8 +30,55 @@ class SalesService:
         self.inventory_service = InventoryService(session)
 
     def list_sales(self) -> Sequence[Sale]:
+        """Return every sale in listing order, unpaged.
+
+        The sales view pages through :meth:`list_sales_page`; this stays as the
+        plain reference listing that the paged query must agree with.
+        """
+
         return self.session.query(Sale).order_by(Sale.sale_date.desc(), Sale.id.desc()).all()
 
+    def list_sales_page(
+        self,
+        *,
+        after: tuple[date, int] | None = None,
+        limit: int = 200,
+        buyer: str | None = None,
+    ) -> Sequence[Sale]:
+        """Return up to ``limit`` sales that follow ``after`` in listing order.
+
+        ``after`` is the ``(sale_date, id)`` of the last sale already shown. Paging
+        on that key rather than an OFFSET means later pages never re-read the
+        rows before them.
+
+        The statement is assembled from cached lambdas: each combination of
+        filters is compiled once, and later calls only bind new values.
+        """
+
+        stmt = lambda_stmt(lambda: select(Sale).order_by(Sale.sale_date.desc(), Sale.id.desc()))
+        if buyer:
+            pattern = self._buyer_pattern(buyer)
+            stmt += lambda s: s.where(func.lower(Sale.buyer).like(pattern, escape="/"))
+        if after is not None:
+            after_date, after_id = after
+            stmt += lambda s: s.where(
+                or_(
+                    Sale.sale_date < after_date,
+                    and_(Sale.sale_date == after_date, Sale.id < after_id),
+                )
+            )
+        stmt += lambda s: s.limit(limit)
+        return self.session.scalars(stmt).all()
+
+    def get_sale(self, sale_id: int) -> Sale | None:
+        """Load a sale together with its items and their inventory rows."""
+
+        return self.session.get(
+            Sale,
+            sale_id,
+            options=[selectinload(Sale.items).joinedload(SaleItem.inventory_item)],
+        )
+
     def create_sale(self, sale: Sale, lines: Sequence[SaleLine]) -> Sale:
         sale.total_value = Decimal("0")
         sale.total_cost = Decimal("0")
@@ -92,6 +140,38 @@ class SalesService:
             self.session.delete(line)
         self.session.delete(sale)
 
+    def delete_sales(self, sale_ids: Sequence[int]) -> None:
+        """Delete several sales at once and return their items to stock.
+
+        Mirrors :meth:`delete_sale`, but loads every sale with its items and
+        inventory rows in one pass and removes them with set-based statements.
+        """
+
+        ids = list(sale_ids)
+        if not ids:
+            return
+
+        sales = self.session.scalars(
+            select(Sale)
+            .where(Sale.id.in_(ids))
+            .options(selectinload(Sale.items).joinedload(SaleItem.inventory_item))
+        ).all()
+        for sale in sales:
+            self._restore_inventory(sale)
+        self.session.flush()
+
+        self.session.execute(delete(SaleItem).where(SaleItem.sale_id.in_(ids)))
+        self.session.execute(delete(Sale).where(Sale.id.in_(ids)))
+
+    @staticmethod
+    def _buyer_pattern(buyer_substr: str) -> str:
+        """Return a ``LIKE`` pattern (escape ``/``) matching ``buyer_substr`` anywhere."""
+
+        escaped = (
+            buyer_substr.lower().replace("/", "//").replace("%", "/%").replace("_", "/_")
+        )
+        return f"%{escaped}%"
+
     def _get_inventory_item(self, item_id: int) -> InventoryItem:
         item = self.session.get(InventoryItem, item_id)
         if item is None:
@@ -27,6 +27,7 @@ class GiftCardTableModel(QAbstractTableModel):
     def __init__(self, rows: Sequence[GiftCard] | None = None) -> None:
         super().__init__()
         self._rows: List[GiftCard] = list(rows or [])
+        self._search_keys: List[str] = self._build_search_keys(self._rows)
 
     # Required Qt model overrides -------------------------------------------------
     def rowCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802
@@ -72,15 +73,22 @@ class GiftCardTableModel(QAbstractTableModel):
     def set_rows(self, rows: Sequence[GiftCard]) -> None:
         self.beginResetModel()
         self._rows = list(rows)
+        self._search_keys = self._build_search_keys(self._rows)
         self.endResetModel()
 
     def row_at(self, row_index: int) -> GiftCard:
         return self._rows[row_index]
 
-    def all_rows(self) -> List[GiftCard]:
-        return list(self._rows)
+    def search_keys(self) -> List[str]:
+        """Return lowercased ``sku<US>card_number`` keys, one per row, for substring search."""
+
+        return self._search_keys
 
     # Internal helpers -----------------------------------------------------------
+    @staticmethod
+    def _build_search_keys(rows: Sequence[GiftCard]) -> List[str]:
+        return [f"{card.sku.lower()}\x1f{card.card_number.lower()}" for card in rows]
+
     def _display_value(self, card: GiftCard, column: int):
         if column == 0:
             return card.sku
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable, List
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QItemSelection, QItemSelectionModel, Qt
 from PySide6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
@@ -23,6 +23,7 @@ from PySide6.QtWidgets import (
 from ...core import session_scope
 from ...models import GiftCard, Retailer
 from ...services import GiftCardService
+from ..search import debounce_search
 from .model import GiftCardTableModel
 
 
@@ -61,7 +62,7 @@ class GiftCardInventoryView(QWidget):
         self._retailer_filter.currentIndexChanged.connect(self.refresh)
         self._search_field = QLineEdit()
         self._search_field.setPlaceholderText("Search by SKU or card number…")
-        self._search_field.textChanged.connect(self._apply_search_filter)
+        debounce_search(self._search_field, self._apply_search_filter)
 
         self._toolbar = self._build_toolbar()
 
@@ -166,16 +167,31 @@ class GiftCardInventoryView(QWidget):
             self._table.viewport().update()
             return
 
-        matches: List[int] = []
-        for row_index, card in enumerate(self._model.all_rows()):
-            if text in card.sku.lower() or text in card.card_number.lower():
-                matches.append(row_index)
+        matches = [row for row, key in enumerate(self._model.search_keys()) if text in key]
 
-        selection_model = self._table.selectionModel()
-        selection_model.clearSelection()
-        for row in matches:
-            index = self._model.index(row, 0)
-            selection_model.select(index, selection_model.Select | selection_model.Rows)
+        # One range per run of consecutive matches keeps the selection compact.
+        last_column = self._model.columnCount() - 1
+        selection = QItemSelection()
+        for start, end in self._contiguous_runs(matches):
+            selection.select(self._model.index(start, 0), self._model.index(end, last_column))
+
+        self._table.setUpdatesEnabled(False)
+        try:
+            self._table.selectionModel().select(
+                selection, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows
+            )
+        finally:
+            self._table.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _contiguous_runs(rows: List[int]) -> List[tuple[int, int]]:
+        runs: List[tuple[int, int]] = []
+        for row in rows:
+            if runs and runs[-1][1] == row - 1:
+                runs[-1] = (runs[-1][0], row)
+            else:
+                runs.append((row, row))
+        return runs
 
     # ----------------------------------------------------------- Context menu --
     def _show_context_menu(self, position) -> None:
@@ -237,9 +253,6 @@ class GiftCardInventoryView(QWidget):
 
     # --------------------------------------------------------- Helper methods --
     def _current_selection(self) -> GiftCardSelection:
-        selection_model = self._table.selectionModel()
-        selected_rows = selection_model.selectedRows()
-        rows: List[GiftCard] = []
-        for index in selected_rows:
-            rows.append(self._model.row_at(index.row()))
-        return GiftCardSelection(rows)
\ No newline at end of file
+        row_at = self._model.row_at
+        selected_rows = self._table.selectionModel().selectedRows()
+        return GiftCardSelection([row_at(index.row()) for index in selected_rows])
\ No newline at end of file
@@ -7,13 +7,14 @@ from .dialogs import (
     InventoryItemDialogResult,
 )
 from .history import InventoryMovementDialog
-from .model import InventoryTableModel
+from .model import InventoryFilterProxy, InventoryTableModel
 from .tab import InventoryTab
 from .view import InventoryView
 
 __all__ = [
     "InventoryAdjustmentDialog",
     "InventoryAdjustmentDialogResult",
+    "InventoryFilterProxy",
     "InventoryItemDialog",
     "InventoryItemDialogResult",
     "InventoryMovementDialog",
@@ -8,6 +8,7 @@ from typing import List, Sequence
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
 from ...models import InventoryItem
+from ..search import SORT_ROLE, SearchFilterProxy, replace_rows
 
 
 class InventoryTableModel(QAbstractTableModel):
@@ -25,6 +26,7 @@ class InventoryTableModel(QAbstractTableModel):
     def __init__(self, rows: Sequence[InventoryItem] | None = None) -> None:
         super().__init__()
         self._rows: List[InventoryItem] = list(rows or [])
+        self._search_keys: List[str] = self._build_search_keys(self._rows)
 
     def rowCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802
         if parent and parent.isValid():
@@ -46,6 +48,9 @@ class InventoryTableModel(QAbstractTableModel):
         if role == Qt.DisplayRole:
             return self._display_value(item, column)
 
+        if role == SORT_ROLE:
+            return self._sort_value(item, column)
+
         if role == Qt.TextAlignmentRole and column in (3, 4, 5):
             return Qt.AlignRight | Qt.AlignVCenter
 
@@ -62,15 +67,24 @@ class InventoryTableModel(QAbstractTableModel):
         return super().headerData(section, orientation, role)
 
     def set_rows(self, rows: Sequence[InventoryItem]) -> None:
-        self.beginResetModel()
-        self._rows = list(rows)
-        self.endResetModel()
+        rows = list(rows)
+        replace_rows(self, self._rows, rows, lambda: self._load(rows))
 
     def row_at(self, row_index: int) -> InventoryItem:
         return self._rows[row_index]
 
-    def all_rows(self) -> List[InventoryItem]:
-        return list(self._rows)
+    def search_keys(self) -> List[str]:
+        """Return lowercased ``name<US>sku`` keys, one per row, for substring search."""
+
+        return self._search_keys
+
+    def _load(self, rows: List[InventoryItem]) -> None:
+        self._rows = rows
+        self._search_keys = self._build_search_keys(rows)
+
+    @staticmethod
+    def _build_search_keys(rows: Sequence[InventoryItem]) -> List[str]:
+        return [f"{(item.item_name or '').lower()}\x1f{(item.sku or '').lower()}" for item in rows]
 
     def _display_value(self, item: InventoryItem, column: int):
         if column == 0:
@@ -87,10 +101,34 @@ class InventoryTableModel(QAbstractTableModel):
             return self._format_currency(item.total_cost)
         return ""
 
+    @staticmethod
+    def _sort_value(item: InventoryItem, column: int):
+        # Numeric columns sort as numbers rather than as their display text.
+        if column == 0:
+            return item.item_name or ""
+        if column == 1:
+            return item.sku or ""
+        if column == 2:
+            return item.upc or ""
+        if column == 3:
+            return item.quantity_on_hand or 0
+        if column == 4:
+            return float(item.average_cost or 0)
+        if column == 5:
+            return float(item.total_cost or 0)
+        return ""
+
     @staticmethod
     def _format_currency(value: Decimal | float | int | None) -> str:
         if value is None:
             return ""
         if isinstance(value, Decimal):
             return f"${value:.2f}"
-        return f"${Decimal(value):.2f}"
\ No newline at end of file
+        return f"${Decimal(value):.2f}"
+
+
+class InventoryFilterProxy(SearchFilterProxy):
+    """Proxy that hides items whose name and SKU do not contain the search text."""
+
+    def _row_matches(self, source_row: int, needle: str) -> bool:
+        return needle in self.sourceModel().search_keys()[source_row]
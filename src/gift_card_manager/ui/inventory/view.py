@@ -10,6 +10,7 @@ from typing import Iterable, List
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QLineEdit,
     QMenu,
@@ -25,9 +26,10 @@ from ...core import session_scope
 from ...models import InventoryItem, InventoryMovement
 from ...models.enums import InventorySourceType
 from ...services import InventoryAdjustment, InventoryService
+from ..search import debounce_search
 from .dialogs import InventoryAdjustmentDialog, InventoryItemDialog
 from .history import InventoryMovementDialog
-from .model import InventoryTableModel
+from .model import InventoryFilterProxy, InventoryTableModel
 
 logger = logging.getLogger(__name__)
 
@@ -53,17 +55,22 @@ class InventoryView(QWidget):
         super().__init__(parent)
 
         self._model = InventoryTableModel()
+        self._proxy = InventoryFilterProxy(self)
+        self._proxy.setSourceModel(self._model)
         self._table = QTableView()
-        self._table.setModel(self._model)
+        self._table.setModel(self._proxy)
         self._table.setSelectionBehavior(QTableView.SelectRows)
         self._table.setSelectionMode(QTableView.ExtendedSelection)
         self._table.setAlternatingRowColors(True)
+        # Keep the query's name ordering until the user picks a sort column.
+        self._table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
         self._table.setSortingEnabled(True)
         self._table.horizontalHeader().setStretchLastSection(True)
+        self._table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
 
         self._search_field = QLineEdit()
         self._search_field.setPlaceholderText("Search by item name or SKU…")
-        self._search_field.textChanged.connect(self._apply_search_filter)
+        debounce_search(self._search_field, self._apply_search_filter)
 
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -121,26 +128,20 @@ class InventoryView(QWidget):
     def refresh(self) -> None:
         with session_scope() as session:
             items = self._load_inventory(session)
-        self._model.set_rows(items)
-        self._apply_search_filter(self._search_field.text())
+        self._table.setUpdatesEnabled(False)
+        self._table.setSortingEnabled(False)
+        try:
+            self._model.set_rows(items)
+        finally:
+            self._table.setSortingEnabled(True)
+            self._table.setUpdatesEnabled(True)
 
     def _load_inventory(self, session) -> Iterable[InventoryItem]:
         return session.query(InventoryItem).order_by(InventoryItem.item_name).all()
 
     # ---------------------------------------------------------- Search ------
     def _apply_search_filter(self, text: str) -> None:
-        text = text.strip().lower()
-        selection_model = self._table.selectionModel()
-        selection_model.clearSelection()
-
-        if not text:
-            self._table.viewport().update()
-            return
-
-        for row_index, item in enumerate(self._model.all_rows()):
-            if text in (item.item_name or "").lower() or text in (item.sku or "").lower():
-                index = self._model.index(row_index, 0)
-                selection_model.select(index, selection_model.Select | selection_model.Rows)
+        self._proxy.set_needle(text)
 
     # ---------------------------------------------------- Context menu -----
     def _show_context_menu(self, position) -> None:
@@ -322,9 +323,7 @@ class InventoryView(QWidget):
 
     # --------------------------------------------------------- Helpers ------
     def _current_selection(self) -> InventorySelection:
-        selection_model = self._table.selectionModel()
-        selected_rows = selection_model.selectedRows()
-        rows: List[InventoryItem] = []
-        for index in selected_rows:
-            rows.append(self._model.row_at(index.row()))
-        return InventorySelection(rows)
\ No newline at end of file
+        row_at = self._model.row_at
+        map_to_source = self._proxy.mapToSource
+        selected_rows = self._table.selectionModel().selectedRows()
+        return InventorySelection([row_at(map_to_source(index).row()) for index in selected_rows])
\ No newline at end of file
@@ -1,13 +1,15 @@
 """Orders UI components."""
 
 from .dialogs import OrderDialog, OrderDialogResult
-from .model import OrdersTableModel
+from .model import OrderRow, OrdersFilterProxy, OrdersTableModel
 from .tab import OrdersTab
 from .view import OrdersView
 
 __all__ = [
     "OrderDialog",
     "OrderDialogResult",
+    "OrderRow",
+    "OrdersFilterProxy",
     "OrdersTableModel",
     "OrdersTab",
     "OrdersView",
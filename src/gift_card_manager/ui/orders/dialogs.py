@@ -30,6 +30,8 @@ from ...models import GiftCard, Order, Retailer
 from ...models.enums import OrderStatus, PaymentMethod
 from ...services import GiftCardAllocation
 
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
 
 @dataclass
 class OrderDialogResult:
@@ -224,7 +226,7 @@ class OrderDialog(QDialog):
         self._allocation_combo.blockSignals(True)
         self._allocation_combo.clear()
 
-        retailer = self._retailer_combo.currentData(Qt.ItemDataRole.UserRole)
+        retailer = self._retailer_combo.currentData(_USER_ROLE)
         if retailer is None:
             self._allocation_combo.blockSignals(False)
             return
@@ -244,7 +246,7 @@ class OrderDialog(QDialog):
         self._allocation_combo.blockSignals(False)
 
     def _add_allocation(self) -> None:
-        card: GiftCard | None = self._allocation_combo.currentData(Qt.ItemDataRole.UserRole)
+        card: GiftCard | None = self._allocation_combo.currentData(_USER_ROLE)
         if card is None:
             QMessageBox.warning(self, "Allocation", "Select a gift card.")
             return
@@ -275,7 +277,7 @@ class OrderDialog(QDialog):
 
     # ---------------------------------------------------------------- Accept
     def accept(self) -> None:
-        retailer = self._retailer_combo.currentData(Qt.ItemDataRole.UserRole)
+        retailer = self._retailer_combo.currentData(_USER_ROLE)
         if retailer is None:
             QMessageBox.warning(self, "Validation", "Select a retailer.")
             return
@@ -288,5 +290,5 @@ class OrderDialog(QDialog):
         order_date = self._date_field.date().toPython()
         email = self._email_field.text().strip() or None
 
-        payment_method = self._payment_combo.currentData(Qt.ItemDataRole.UserRole)
-        status = self._status_combo.currentData(Qt.Item)
\ No newline at end of file
+        payment_method = self._payment_combo.currentData(_USER_ROLE)
+        status = self._status_combo.currentData(_USER_ROLE)
\ No newline at end of file
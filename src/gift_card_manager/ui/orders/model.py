@@ -2,13 +2,34 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from typing import List, Sequence
+from typing import List, Sequence, Set
 
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
-from ...models import Order
+from ...models.enums import OrderStatus
+from ..search import SORT_ROLE, SearchFilterProxy, replace_rows
+
+_CURRENCY_FMT = "${:.2f}".format
+
+_DISPLAY_ROLE = Qt.DisplayRole
+_ALIGN_ROLE = Qt.TextAlignmentRole
+_RIGHT_ALIGN = int(Qt.AlignRight | Qt.AlignVCenter)
+
+
+@dataclass(frozen=True, slots=True)
+class OrderRow:
+    """Read-only projection of the order columns shown in the table."""
+
+    id: int
+    order_number: str
+    order_date: date
+    retailer_name: str | None
+    total_cost: Decimal
+    gift_card_spend: Decimal
+    status: OrderStatus
 
 
 class OrdersTableModel(QAbstractTableModel):
@@ -23,9 +44,40 @@ class OrdersTableModel(QAbstractTableModel):
         "Status",
     ]
 
-    def __init__(self, rows: Sequence[Order] | None = None) -> None:
+    # One formatter per column, indexed by column number.
+    _DISPLAY = (
+        lambda order, model: order.order_number,
+        lambda order, model: order.retailer_name or "",
+        lambda order, model: model._format_date(order.order_date),
+        lambda order, model: model._format_currency(order.total_cost),
+        lambda order, model: model._format_currency(order.gift_card_spend),
+        lambda order, model: (
+            order.status.value if hasattr(order.status, "value") else str(order.status)
+        ),
+    )
+
+    # Sort key per column: text as-is, dates as ordinals and amounts as floats,
+    # since Qt cannot compare Python ``date``/``Decimal`` objects.
+    _SORT = (
+        lambda order: order.order_number or "",
+        lambda order: order.retailer_name or "",
+        lambda order: order.order_date.toordinal() if order.order_date else 0,
+        lambda order: float(order.total_cost or 0),
+        lambda order: float(order.gift_card_spend or 0),
+        lambda order: (
+            order.status.value if hasattr(order.status, "value") else str(order.status)
+        ),
+    )
+
+    def __init__(self, rows: Sequence[OrderRow] | None = None) -> None:
         super().__init__()
-        self._rows: List[Order] = list(rows or [])
+        self._rows: List[OrderRow] = []
+        self._columns: List[List[str]] = []
+        self._sort_columns: List[list] = []
+        self._search_keys: List[str] = []
+        self._match_needle: str | None = None
+        self._match_rows: Set[int] = set()
+        self._load(list(rows or []))
 
     def rowCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802
         if parent and parent.isValid():
@@ -41,14 +93,14 @@ class OrdersTableModel(QAbstractTableModel):
         if not index.isValid():
             return None
 
-        order = self._rows[index.row()]
-        column = index.column()
+        if role == _DISPLAY_ROLE:
+            return self._columns[index.column()][index.row()]
 
-        if role == Qt.DisplayRole:
-            return self._display_value(order, column)
+        if role == SORT_ROLE:
+            return self._sort_columns[index.column()][index.row()]
 
-        if role == Qt.TextAlignmentRole and column in (3, 4):
-            return Qt.AlignRight | Qt.AlignVCenter
+        if role == _ALIGN_ROLE and index.column() in (3, 4):
+            return _RIGHT_ALIGN
 
         return None
 
@@ -58,46 +110,62 @@ class OrdersTableModel(QAbstractTableModel):
         orientation: Qt.Orientation,
         role: int = Qt.DisplayRole,
     ):
-        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+        if orientation == Qt.Horizontal and role == _DISPLAY_ROLE:
             return self.HEADERS[section]
         return super().headerData(section, orientation, role)
 
-    def set_rows(self, rows: Sequence[Order]) -> None:
-        self.beginResetModel()
-        self._rows = list(rows)
-        self.endResetModel()
+    def set_rows(self, rows: Sequence[OrderRow]) -> None:
+        rows = list(rows)
+        if rows == self._rows:
+            # OrderRow compares by value, so an identical result changes nothing.
+            return
+        replace_rows(self, self._rows, rows, lambda: self._load(rows))
 
-    def row_at(self, row_index: int) -> Order:
+    def row_at(self, row_index: int) -> OrderRow:
         return self._rows[row_index]
 
-    def all_rows(self) -> List[Order]:
-        return list(self._rows)
-
-    def _display_value(self, order: Order, column: int):
-        if column == 0:
-            return order.order_number
-        if column == 1:
-            return order.retailer.name if order.retailer else ""
-        if column == 2:
-            return self._format_date(order.order_date)
-        if column == 3:
-            return self._format_currency(order.total_cost)
-        if column == 4:
-            return self._format_currency(order.gift_card_spend)
-        if column == 5:
-            return order.status.value if hasattr(order.status, "value") else str(order.status)
-        return ""
+    def matching_rows(self, needle: str) -> Set[int]:
+        """Return the row indexes whose search key contains ``needle``.
+
+        When ``needle`` extends the previous query, only the previous matches are
+        rescanned, so each keystroke narrows the candidate set instead of
+        re-reading every key.
+        """
+
+        previous = self._match_needle
+        if needle == previous:
+            return self._match_rows
+
+        keys = self._search_keys
+        if previous and previous in needle:
+            candidates = self._match_rows
+        else:
+            candidates = range(len(keys))
+        self._match_rows = {row for row in candidates if needle in keys[row]}
+        self._match_needle = needle
+        return self._match_rows
+
+    def _load(self, rows: List[OrderRow]) -> None:
+        # Format every cell once here so data() is two list lookups per paint.
+        self._rows = rows
+        self._columns = [[fmt(order, self) for order in rows] for fmt in self._DISPLAY]
+        self._sort_columns = [[key(order) for order in rows] for key in self._SORT]
+        self._search_keys = [(order.order_number or "").lower() for order in rows]
+        self._match_needle = None
 
     @staticmethod
     def _format_date(value: date | None) -> str:
-        if not value:
-            return ""
-        return value.strftime("%Y-%m-%d")
+        return value.isoformat() if value else ""
 
     @staticmethod
     def _format_currency(value: Decimal | float | int | None) -> str:
         if value is None:
             return ""
-        if isinstance(value, Decimal):
-            return f"${value:.2f}"
-        return f"${Decimal(value):.2f}"
\ No newline at end of file
+        return _CURRENCY_FMT(value)
+
+
+class OrdersFilterProxy(SearchFilterProxy):
+    """Proxy that hides orders whose number does not contain the search text."""
+
+    def _row_matches(self, source_row: int, needle: str) -> bool:
+        return source_row in self.sourceModel().matching_rows(needle)
\ No newline at end of file
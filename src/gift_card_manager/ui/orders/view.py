@@ -6,9 +6,9 @@ import logging
 from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
-from typing import Iterable, List
+from typing import List
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QThreadPool, Qt
 from PySide6.QtWidgets import (
     QComboBox,
     QFileDialog,
@@ -23,25 +23,29 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
+from sqlalchemy import Select, select
 
 from ...core import session_scope
+from ...io.order_csv import export_orders_to_csv, import_orders_from_csv
 from ...models import Order, Retailer
 from ...services import OrderService
+from ..search import debounce_search
+from ..workers import SessionWorker, WorkerSignals
 from .dialogs import OrderDialog
-from .model import OrdersTableModel
+from .model import OrderRow, OrdersFilterProxy, OrdersTableModel
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderSelection:
-    rows: List[Order]
+    rows: List[OrderRow]
 
     @property
     def count(self) -> int:
         return len(self.rows)
 
-    def ensure_single(self) -> Order | None:
+    def ensure_single(self) -> OrderRow | None:
         if self.count != 1:
             return None
         return self.rows[0]
@@ -54,20 +58,36 @@ class OrdersView(QWidget):
         super().__init__(parent)
 
         self._model = OrdersTableModel()
+        self._proxy = OrdersFilterProxy(self)
+        self._proxy.setSourceModel(self._model)
         self._table = QTableView()
-        self._table.setModel(self._model)
+        self._table.setModel(self._proxy)
         self._table.setSelectionBehavior(QTableView.SelectRows)
         self._table.setSelectionMode(QTableView.ExtendedSelection)
         self._table.setAlternatingRowColors(True)
+        # Keep the query's date ordering until the user picks a sort column.
+        self._table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
         self._table.setSortingEnabled(True)
         self._table.horizontalHeader().setStretchLastSection(True)
 
         self._retailer_filter = QComboBox()
         self._retailer_filter.currentIndexChanged.connect(self.refresh)
+        self._retailer_id_by_code: dict[str, int] = {}
+        self._retailer_signature: tuple[tuple[int, str, str], ...] | None = None
 
         self._search_field = QLineEdit()
         self._search_field.setPlaceholderText("Search by order number…")
-        self._search_field.textChanged.connect(self._apply_search_filter)
+        debounce_search(self._search_field, self._apply_search_filter)
+
+        # SQL runs on the global thread pool; results come back through these
+        # signals. The token lets a refresh ignore results it has superseded.
+        self._refresh_token = 0
+        self._load_signals = WorkerSignals(self)
+        self._load_signals.finished.connect(self._on_orders_loaded)
+        self._load_signals.failed.connect(self._on_orders_failed)
+        self._delete_signals = WorkerSignals(self)
+        self._delete_signals.finished.connect(lambda _token, _result: self.refresh())
+        self._delete_signals.failed.connect(self._on_delete_failed)
 
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -126,31 +146,69 @@ class OrdersView(QWidget):
 
     # -------------------------------------------------------------- Data ----
     def refresh(self) -> None:
-        with session_scope() as session:
-            orders = self._load_orders(session)
-        self._model.set_rows(orders)
-        self._apply_search_filter(self._search_field.text())
+        self._refresh_token += 1
+        stmt = self._orders_statement()
+        if stmt is None:
+            self._model.set_rows([])
+            return
+        worker = SessionWorker(
+            lambda session: [OrderRow(*row) for row in session.execute(stmt)],
+            self._load_signals,
+            self._refresh_token,
+        )
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_orders_loaded(self, token: int, rows: List[OrderRow]) -> None:
+        if token != self._refresh_token:
+            return
+        self._model.set_rows(rows)
 
-    def _load_orders(self, session) -> Iterable[Order]:
-        query = session.query(Order).order_by(Order.order_date.desc(), Order.id.desc())
+    def _on_orders_failed(self, token: int, message: str) -> None:
+        if token != self._refresh_token:
+            return
+        QMessageBox.critical(self, "Orders", f"Failed to load orders:\n{message}")
+
+    def _orders_statement(self) -> Select | None:
+        """Build the listing query for the current filter, or ``None`` if it matches nothing."""
+
+        stmt = (
+            select(
+                Order.id,
+                Order.order_number,
+                Order.order_date,
+                Retailer.name,
+                Order.total_cost,
+                Order.gift_card_spend,
+                Order.status,
+            )
+            .join(Retailer, Order.retailer_id == Retailer.id)
+            .order_by(Order.order_date.desc(), Order.id.desc())
+        )
         retailer_code = self._current_retailer_code()
         if retailer_code != "ALL":
-            retailer = (
-                session.query(Retailer).filter(Retailer.code == retailer_code).one_or_none()
-            )
-            if not retailer:
-                return []
-            query = query.filter(Order.retailer_id == retailer.id)
-        return query.all()
+            retailer_id = self._retailer_id_by_code.get(retailer_code)
+            if retailer_id is None:
+                return None
+            stmt = stmt.where(Order.retailer_id == retailer_id)
+        return stmt
 
     def _load_retailers(self) -> None:
+        with session_scope() as session:
+            retailers = tuple(
+                session.execute(
+                    select(Retailer.id, Retailer.name, Retailer.code).order_by(Retailer.name)
+                ).tuples()
+            )
+        if retailers == self._retailer_signature:
+            return
+        self._retailer_signature = retailers
+
         self._retailer_filter.blockSignals(True)
         self._retailer_filter.clear()
         self._retailer_filter.addItem("All Retailers", "ALL")
-        with session_scope() as session:
-            retailers = session.query(Retailer).order_by(Retailer.name).all()
-        for retailer in retailers:
-            self._retailer_filter.addItem(f"{retailer.name} ({retailer.code})", retailer.code)
+        self._retailer_id_by_code = {code: retailer_id for retailer_id, _name, code in retailers}
+        for _retailer_id, name, code in retailers:
+            self._retailer_filter.addItem(f"{name} ({code})", code)
         self._retailer_filter.blockSignals(False)
 
     def _current_retailer_code(self) -> str:
@@ -158,18 +216,7 @@ class OrdersView(QWidget):
 
     # ---------------------------------------------------------- Search ------
     def _apply_search_filter(self, text: str) -> None:
-        text = text.strip().lower()
-        selection_model = self._table.selectionModel()
-        selection_model.clearSelection()
-
-        if not text:
-            self._table.viewport().update()
-            return
-
-        for row_index, order in enumerate(self._model.all_rows()):
-            if text in (order.order_number or "").lower():
-                index = self._model.index(row_index, 0)
-                selection_model.select(index, selection_model.Select | selection_model.Rows)
+        self._proxy.set_needle(text)
 
     # ---------------------------------------------------- Context menu -----
     def _show_context_menu(self, position) -> None:
@@ -294,33 +341,57 @@ class OrdersView(QWidget):
         if confirm != QMessageBox.Yes:
             return
 
-        with session_scope() as session:
-            service = OrderService(session)
-            for order in selection.rows:
-                db_order = session.get(Order, order.id)
-                if db_order:
-                    service.delete_order(db_order)
-            try:
-                session.commit()
-            except Exception as exc:  # pragma: no cover - UI feedback
-                session.rollback()
-                logger.exception("Failed to delete orders")
-                QMessageBox.critical(self, "Delete Orders", f"Failed to delete orders:\n{exc}")
-                return
+        order_ids = [order.id for order in selection.rows]
+        worker = SessionWorker(
+            lambda session: OrderService(session).delete_orders(order_ids),
+            self._delete_signals,
+        )
+        QThreadPool.globalInstance().start(worker)
 
-        self.refresh()
+    def _on_delete_failed(self, _token: int, message: str) -> None:
+        QMessageBox.critical(self, "Delete Orders", f"Failed to delete orders:\n{message}")
 
     def _export_csv(self) -> None:
-        QMessageBox.information(self, "Export", "Order export not implemented yet.")
+        filename, _ = QFileDialog.getSaveFileName(
+            self, "Export Orders", str(Path.home() / "orders.csv"), "CSV Files (*.csv)"
+        )
+        if not filename:
+            return
+
+        code = self._current_retailer_code()
+        try:
+            with session_scope() as session:
+                count = export_orders_to_csv(
+                    Path(filename), session, retailer_code=None if code == "ALL" else code
+                )
+        except Exception as exc:  # pragma: no cover - UI feedback
+            logger.exception("Failed to export orders")
+            QMessageBox.critical(self, "Export", f"Failed to export orders:\n{exc}")
+            return
+
+        QMessageBox.information(self, "Export", f"Exported {count} order(s).")
 
     def _import_csv(self) -> None:
-        QMessageBox.information(self, "Import", "Order import not implemented yet.")
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Import Orders", str(Path.home()), "CSV Files (*.csv)"
+        )
+        if not filename:
+            return
+
+        try:
+            with session_scope() as session:
+                count = import_orders_from_csv(Path(filename), session)
+        except Exception as exc:  # pragma: no cover - UI feedback
+            logger.exception("Failed to import orders")
+            QMessageBox.critical(self, "Import", f"Failed to import orders:\n{exc}")
+            return
+
+        QMessageBox.information(self, "Import", f"Imported {count} order(s).")
+        self.refresh()
 
     # --------------------------------------------------------- Helpers ------
     def _current_selection(self) -> OrderSelection:
-        selection_model = self._table.selectionModel()
-        selected_rows = selection_model.selectedRows()
-        rows: List[Order] = []
-        for index in selected_rows:
-            rows.append(self._model.row_at(index.row()))
-        return OrderSelection(rows)
\ No newline at end of file
+        row_at = self._model.row_at
+        map_to_source = self._proxy.mapToSource
+        selected_rows = self._table.selectionModel().selectedRows()
+        return OrderSelection([row_at(map_to_source(index).row()) for index in selected_rows])
\ No newline at end of file
@@ -19,18 +19,20 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QListWidget,
-    QListWidgetItem,
     QMessageBox,
     QPushButton,
     QVBoxLayout,
     QWidget,
 )
+from sqlalchemy import select
 
 from ...models import InventoryItem, Sale
 from ...services import SaleLine, SalesService
 
+_CENTS = Decimal("0.01")
 
-@dataclass
+
+@dataclass(slots=True)
 class SaleLineEntry:
     inventory_item_id: int
     description: str
@@ -38,11 +40,11 @@ class SaleLineEntry:
     unit_price: Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class SaleDialogResult:
     buyer: str | None
     sale_date: date
-    lines: List[SaleLineEntry]
+    lines: List[SaleLine]
 
 
 class SaleDialog(QDialog):
@@ -54,6 +56,7 @@ class SaleDialog(QDialog):
         session,
         parent: QWidget | None = None,
         existing: Sale | None = None,
+        inventory: Sequence[tuple[int, str, int]] | None = None,
     ) -> None:
         super().__init__(parent)
 
@@ -69,7 +72,7 @@ class SaleDialog(QDialog):
         self._date_field.setDate(QDate.currentDate())
 
         self._inventory_combo = QComboBox()
-        self._load_inventory_items()
+        self._load_inventory_items(inventory)
 
         self._quantity_field = QDoubleSpinBox()
         self._quantity_field.setDecimals(0)
@@ -142,51 +145,54 @@ class SaleDialog(QDialog):
     def result_data(self) -> SaleDialogResult | None:
         return self._result
 
-    def _load_inventory_items(self) -> None:
-        items = (
-            self._session.query(InventoryItem)
-            .order_by(InventoryItem.item_name)
-            .all()
-        )
+    def _load_inventory_items(self, inventory: Sequence[tuple[int, str, int]] | None) -> None:
+        """Fill the item combo from ``(id, name, quantity)`` rows, querying if none are given."""
+
+        if inventory is None:
+            inventory = self._session.execute(
+                select(InventoryItem.id, InventoryItem.item_name, InventoryItem.quantity_on_hand)
+                .order_by(InventoryItem.item_name)
+            ).all()
         self._inventory_combo.clear()
-        for item in items:
-            description = f"{item.item_name} (qty: {item.quantity_on_hand})"
-            self._inventory_combo.addItem(description, item)
+        for item_id, item_name, quantity in inventory:
+            description = f"{item_name} (qty: {quantity})"
+            self._inventory_combo.addItem(description, (item_id, item_name))
 
     def _add_line(self) -> None:
-        inventory_item = self._inventory_combo.currentData(Qt.ItemDataRole.UserRole)
-        if inventory_item is None:
+        selected = self._inventory_combo.currentData(Qt.ItemDataRole.UserRole)
+        if selected is None:
             QMessageBox.warning(self, "Line Item", "Select an inventory item.")
             return
+        inventory_item_id, item_name = selected
         quantity = int(self._quantity_field.value())
         if quantity <= 0:
             QMessageBox.warning(self, "Line Item", "Quantity must be greater than zero.")
             return
-        unit_price = Decimal(str(self._price_field.value())).quantize(Decimal("0.01"))
-        description = inventory_item.item_name or f"Item {inventory_item.id}"
+        unit_price = Decimal(str(self._price_field.value())).quantize(_CENTS)
+        description = item_name or f"Item {inventory_item_id}"
         entry = SaleLineEntry(
-            inventory_item_id=inventory_item.id,
+            inventory_item_id=inventory_item_id,
             description=description,
             quantity=quantity,
             unit_price=unit_price,
         )
         self._lines.append(entry)
-        self._refresh_line_list()
+        self._line_list.addItem(self._line_label(entry))
 
     def _remove_selected_line(self) -> None:
         selected = self._line_list.currentRow()
         if selected < 0:
             return
+        self._line_list.takeItem(selected)
         self._lines.pop(selected)
-        self._refresh_line_list()
 
     def _refresh_line_list(self) -> None:
         self._line_list.clear()
-        for entry in self._lines:
-            item = QListWidgetItem(
-                f"{entry.description}: {entry.quantity} @ ${entry.unit_price:.2f}"
-            )
-            self._line_list.addItem(item)
+        self._line_list.addItems([self._line_label(entry) for entry in self._lines])
+
+    @staticmethod
+    def _line_label(entry: SaleLineEntry) -> str:
+        return f"{entry.description}: {entry.quantity} @ ${entry.unit_price:.2f}"
 
     def accept(self) -> None:
         sale_date = self._date_field.date().toPython()
@@ -197,6 +203,9 @@ class SaleDialog(QDialog):
         self._result = SaleDialogResult(
             buyer=buyer,
             sale_date=sale_date,
-            lines=list(self._lines),
+            lines=[
+                SaleLine(entry.inventory_item_id, entry.quantity, entry.unit_price)
+                for entry in self._lines
+            ],
         )
         super().accept()
\ No newline at end of file
@@ -4,21 +4,31 @@ from __future__ import annotations
 
 from datetime import date
 from decimal import Decimal
-from typing import List, Sequence
+from functools import lru_cache
+from typing import Iterable, List, Sequence, Tuple
 
-from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
 
 from ...models import Sale
 
+_CURRENCY_FMT = "${:.2f}".format
+
 
 class SalesTableModel(QAbstractTableModel):
     """Qt model representing sales."""
 
     HEADERS = ["Date", "Buyer", "Total", "Cost", "Profit"]
 
+    # Emitted when the view scrolls to the end of a partial listing; the owner
+    # loads the next page and hands it to append_rows().
+    more_requested = Signal()
+
     def __init__(self, rows: Sequence[Sale] | None = None) -> None:
         super().__init__()
         self._rows: List[Sale] = list(rows or [])
+        self._cells: List[Tuple[str, ...]] = self._build_cells(self._rows)
+        self._has_more = False
+        self._fetching = False
 
     def rowCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802
         if parent and parent.isValid():
@@ -34,11 +44,10 @@ class SalesTableModel(QAbstractTableModel):
         if not index.isValid():
             return None
 
-        sale = self._rows[index.row()]
         column = index.column()
 
         if role == Qt.DisplayRole:
-            return self._display_value(sale, column)
+            return self._cells[index.row()][column]
 
         if role == Qt.TextAlignmentRole and column in (2, 3, 4):
             return Qt.AlignRight | Qt.AlignVCenter
@@ -50,34 +59,71 @@ class SalesTableModel(QAbstractTableModel):
             return self.HEADERS[section]
         return super().headerData(section, orientation, role)
 
-    def set_rows(self, rows: Sequence[Sale]) -> None:
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:  # noqa: N802
+        if parent.isValid():
+            return False
+        return self._has_more and not self._fetching
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:  # noqa: N802
+        if not self.canFetchMore(parent):
+            return
+        self._fetching = True
+        self.more_requested.emit()
+
+    def set_rows(self, rows: Sequence[Sale], has_more: bool = False) -> None:
         self.beginResetModel()
         self._rows = list(rows)
+        self._cells = self._build_cells(self._rows)
+        self._has_more = has_more
+        self._fetching = False
         self.endResetModel()
 
+    def append_rows(self, rows: Sequence[Sale], has_more: bool) -> None:
+        """Add the next page of sales below the rows already loaded."""
+
+        self._has_more = has_more
+        self._fetching = False
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._cells.extend(self._build_cells(rows))
+        self.endInsertRows()
+
+    def cancel_fetch(self) -> None:
+        """Forget an outstanding page request so scrolling can ask again."""
+
+        self._fetching = False
+
+    def last_row(self) -> Sale | None:
+        return self._rows[-1] if self._rows else None
+
     def row_at(self, row_index: int) -> Sale:
         return self._rows[row_index]
 
-    def all_rows(self) -> List[Sale]:
-        return list(self._rows)
-
-    def _display_value(self, sale: Sale, column: int):
-        if column == 0:
-            return sale.sale_date.strftime("%Y-%m-%d") if sale.sale_date else ""
-        if column == 1:
-            return sale.buyer or ""
-        if column == 2:
-            return self._format_currency(sale.total_value)
-        if column == 3:
-            return self._format_currency(sale.total_cost)
-        if column == 4:
-            return self._format_currency(sale.profit)
-        return ""
+    def rows_at(self, row_indices: Iterable[int]) -> List[Sale]:
+        rows = self._rows
+        return [rows[i] for i in row_indices]
+
+    def _build_cells(self, rows: Sequence[Sale]) -> List[Tuple[str, ...]]:
+        # One pass per reset: each row's date, buyer and money properties are
+        # read exactly once, so data() never touches the ORM while painting.
+        fmt = self._format_currency
+        return [
+            (
+                sale.sale_date.strftime("%Y-%m-%d") if sale.sale_date else "",
+                sale.buyer or "",
+                fmt(sale.total_value),
+                fmt(sale.total_cost),
+                fmt(sale.profit),
+            )
+            for sale in rows
+        ]
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _format_currency(value: Decimal | float | int | None) -> str:
         if value is None:
             return ""
-        if isinstance(value, Decimal):
-            return f"${value:.2f}"
-        return f"${Decimal(value):.2f}"
\ No newline at end of file
+        return _CURRENCY_FMT(value)
\ No newline at end of file
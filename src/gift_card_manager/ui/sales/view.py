@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import Callable, Iterable, List, Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QThreadPool, Qt
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -19,17 +19,24 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-
-from ...core import session_scope
-from ...models import Sale
-from ...services import SaleLine, SalesService
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ...core import SessionFactory
+from ...models import InventoryItem, Sale
+from ...services import SalesService
+from ..search import debounce_search
+from ..workers import SessionWorker, WorkerSignals
 from .dialogs import SaleDialog
 from .model import SalesTableModel
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per query; more are loaded as the table scrolls to the end.
+_PAGE_SIZE = 200
+
 
-@dataclass
+@dataclass(slots=True)
 class SaleSelection:
     rows: List[Sale]
 
@@ -46,8 +53,27 @@ class SaleSelection:
 class SalesView(QWidget):
     """Composite widget for sales management."""
 
-    def __init__(self, parent: QWidget | None = None) -> None:
+    # Toolbar layout: (label, handler method name, separator after).
+    _ACTIONS = (
+        ("Add Sale", "_add_sale", False),
+        ("Edit Sale", "_edit_selected", False),
+        ("Delete Sale", "_delete_selected", True),
+        ("Refresh", "refresh", False),
+    )
+
+    def __init__(
+        self,
+        parent: QWidget | None = None,
+        session_factory: Callable[[], Session] = SessionFactory,
+    ) -> None:
         super().__init__(parent)
+        # One session for the lifetime of the tab: each action commits or rolls
+        # back on it instead of building and tearing down a session per click.
+        self._session_factory = session_factory
+        self._session = session_factory()
+        session = self._session
+        self.destroyed.connect(lambda *_args: session.close())
+
         self._model = SalesTableModel()
         self._table = QTableView()
         self._table.setModel(self._model)
@@ -57,9 +83,32 @@ class SalesView(QWidget):
         self._table.setSortingEnabled(True)
         self._table.horizontalHeader().setStretchLastSection(True)
 
+        self._inventory_cache: List[tuple[int, str, int]] = []
+        self._inventory_stale = True
+
+        # Listing queries run on the global thread pool in their own session;
+        # the token lets a newer load discard results from an older one.
+        self._refresh_token = 0
+        # Bumped whenever a load's rows replace the listing; page requests carry
+        # it so a page fetched for an earlier listing is never appended.
+        self._listing_generation = 0
+        self._load_signals = WorkerSignals(self)
+        self._load_signals.finished.connect(self._on_sales_loaded)
+        self._load_signals.failed.connect(self._on_sales_failed)
+        self._page_signals = WorkerSignals(self)
+        self._page_signals.finished.connect(self._on_page_loaded)
+        self._page_signals.failed.connect(self._on_page_failed)
+        self._delete_signals = WorkerSignals(self)
+        self._delete_signals.finished.connect(lambda _token, _result: self.refresh())
+        self._delete_signals.failed.connect(self._on_delete_failed)
+        # Filter behind the rows on screen, and the one a load is fetching.
+        self._buyer_filter = ""
+        self._pending_buyer: str | None = None
+        self._model.more_requested.connect(self._fetch_next_page)
+
         self._search_field = QLineEdit()
         self._search_field.setPlaceholderText("Search by buyer…")
-        self._search_field.textChanged.connect(self._apply_search_filter)
+        debounce_search(self._search_field, self._apply_search_filter, 200)
 
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -77,19 +126,10 @@ class SalesView(QWidget):
         toolbar = QToolBar("Sales Actions", self)
         toolbar.setMovable(False)
 
-        add_action = toolbar.addAction("Add Sale")
-        add_action.triggered.connect(self._add_sale)
-
-        edit_action = toolbar.addAction("Edit Sale")
-        edit_action.triggered.connect(self._edit_selected)
-
-        delete_action = toolbar.addAction("Delete Sale")
-        delete_action.triggered.connect(self._delete_selected)
-
-        toolbar.addSeparator()
-
-        refresh_action = toolbar.addAction("Refresh")
-        refresh_action.triggered.connect(self.refresh)
+        for label, handler_name, separator_after in self._ACTIONS:
+            toolbar.addAction(label).triggered.connect(getattr(self, handler_name))
+            if separator_after:
+                toolbar.addSeparator()
 
         return toolbar
 
@@ -105,68 +145,141 @@ class SalesView(QWidget):
         return row
 
     def refresh(self) -> None:
-        with session_scope() as session:
-            service = SalesService(session)
-            sales = service.list_sales()
-        self._model.set_rows(sales)
-        self._apply_search_filter(self._search_field.text())
+        # End the tab session's read transaction: this hands its connection
+        # back to the pool and expires cached state, so the next action
+        # re-reads stock and sale rows.
+        self._session.rollback()
+        self._inventory_stale = True
+        self._start_load(self._search_field.text())
+
+    def _start_load(self, text: str) -> None:
+        self._refresh_token += 1
+        buyer = self._pending_buyer = text.strip()
+        include_inventory = self._inventory_stale
+        load_inventory = self._load_inventory_choices
+
+        def load(session: Session):
+            sales = SalesService(session).list_sales_page(limit=_PAGE_SIZE + 1, buyer=buyer)
+            inventory = load_inventory(session) if include_inventory else None
+            return buyer, sales, inventory
+
+        worker = SessionWorker(
+            load, self._load_signals, self._refresh_token, self._session_factory
+        )
+        QThreadPool.globalInstance().start(worker)
 
-    def _apply_search_filter(self, text: str) -> None:
-        text = text.strip().lower()
-        selection_model = self._table.selectionModel()
-        selection_model.clearSelection()
+    def _on_sales_loaded(self, token: int, result) -> None:
+        if token != self._refresh_token:
+            return
+        buyer, sales, inventory = result
+        self._listing_generation += 1
+        self._buyer_filter = buyer
+        self._pending_buyer = None
+        if inventory is not None:
+            self._inventory_cache = inventory
+            self._inventory_stale = False
+        # Hold repaints until the reset is done so the table paints once.
+        self._table.setUpdatesEnabled(False)
+        try:
+            self._model.set_rows(sales[:_PAGE_SIZE], has_more=len(sales) > _PAGE_SIZE)
+        finally:
+            self._table.setUpdatesEnabled(True)
+
+    def _fetch_next_page(self) -> None:
+        last = self._model.last_row()
+        if last is None:
+            self._model.append_rows([], has_more=False)
+            return
+        after = (last.sale_date, last.id)
+        buyer = self._buyer_filter
+        worker = SessionWorker(
+            lambda session: (
+                after,
+                SalesService(session).list_sales_page(
+                    after=after, limit=_PAGE_SIZE + 1, buyer=buyer
+                ),
+            ),
+            self._page_signals,
+            self._listing_generation,
+            self._session_factory,
+        )
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_page_loaded(self, token: int, result) -> None:
+        after, sales = result
+        last = self._model.last_row()
+        # Only extend the listing the page was requested for, from the row it
+        # was requested after.
+        if (
+            token != self._listing_generation
+            or last is None
+            or (last.sale_date, last.id) != after
+        ):
+            return
+        self._model.append_rows(sales[:_PAGE_SIZE], has_more=len(sales) > _PAGE_SIZE)
 
-        if not text:
-            self._table.viewport().update()
+    def _on_page_failed(self, token: int, message: str) -> None:
+        if token != self._listing_generation:
             return
+        self._model.append_rows([], has_more=False)
+        QMessageBox.critical(self, "Sales", f"Failed to load more sales:\n{message}")
+
+    def _on_sales_failed(self, token: int, message: str) -> None:
+        if token != self._refresh_token:
+            return
+        self._pending_buyer = None
+        self._model.cancel_fetch()
+        QMessageBox.critical(self, "Sales", f"Failed to load sales:\n{message}")
+
+    @staticmethod
+    def _load_inventory_choices(session) -> List[tuple[int, str, int]]:
+        """Return ``(id, name, quantity)`` rows for the sale dialog's item picker."""
+
+        rows = session.execute(
+            select(InventoryItem.id, InventoryItem.item_name, InventoryItem.quantity_on_hand)
+            .order_by(InventoryItem.item_name)
+        )
+        return [tuple(row) for row in rows]
 
-        for row_index, sale in enumerate(self._model.all_rows()):
-            if text in (sale.buyer or "").lower():
-                index = self._model.index(row_index, 0)
-                selection_model.select(index, selection_model.Select | selection_model.Rows)
+    def _apply_search_filter(self, text: str) -> None:
+        # Typing and erasing within one debounce window lands on the same filter.
+        target = self._buyer_filter if self._pending_buyer is None else self._pending_buyer
+        if text.strip() == target:
+            return
+        self._start_load(text)
 
     def _show_context_menu(self, position) -> None:
         menu = QMenu(self)
         menu.addAction("Add Sale", self._add_sale)
-        selection = self._current_selection()
-        if selection.count:
+        if self._selected_count():
             menu.addSeparator()
             menu.addAction("Edit Sale", self._edit_selected)
             menu.addAction("Delete Sale", self._delete_selected)
         menu.exec(self._table.viewport().mapToGlobal(position))
 
     def _add_sale(self) -> None:
-        with session_scope() as session:
-            dialog = SaleDialog(session=session, parent=self)
-            if dialog.exec() != SaleDialog.Accepted:
-                return
-            result = dialog.result_data()
-            if result is None:
-                return
-
-            sale = Sale(
-                buyer=result.buyer,
-                sale_date=result.sale_date,
-            )
-
-            service = SalesService(session)
-            lines = [
-                SaleLine(
-                    inventory_item_id=line.inventory_item_id,
-                    quantity=line.quantity,
-                    unit_price=line.unit_price,
-                )
-                for line in result.lines
-            ]
-
-            try:
-                service.create_sale(sale, lines)
-                session.commit()
-            except Exception as exc:  # pragma: no cover - UI feedback
-                session.rollback()
-                logger.exception("Failed tocreate sale")
-                QMessageBox.critical(self, "Add Sale", f"Failed to create sale:\n{exc}")
-                return
+        session = self._session
+        dialog = SaleDialog(session=session, parent=self, inventory=self._dialog_inventory())
+        result = dialog.result_data() if dialog.exec() == SaleDialog.Accepted else None
+        if result is None:
+            # The dialog may have read stock; release that transaction.
+            session.rollback()
+            return
+
+        sale = Sale(
+            buyer=result.buyer,
+            sale_date=result.sale_date,
+        )
+
+        service = SalesService(session)
+        try:
+            service.create_sale(sale, result.lines)
+            session.commit()
+        except Exception as exc:  # pragma: no cover - UI feedback
+            session.rollback()
+            logger.exception("Failed tocreate sale")
+            QMessageBox.critical(self, "Add Sale", f"Failed to create sale:\n{exc}")
+            return
 
         self.refresh()
 
@@ -177,50 +290,47 @@ class SalesView(QWidget):
             QMessageBox.information(self, "Edit Sale", "Select one sale to edit.")
             return
 
-        with session_scope() as session:
-            db_sale = session.get(Sale, sale.id)
-            if db_sale is None:
-                QMessageBox.warning(self, "Edit Sale", "Selected sale no longer exists.")
-                return
-
-            dialog = SaleDialog(session=session, parent=self, existing=db_sale)
-            if dialog.exec() != SaleDialog.Accepted:
-                return
-            result = dialog.result_data()
-            if result is None:
-                return
-
-            db_sale.buyer = result.buyer
-            db_sale.sale_date = result.sale_date
-
-            service = SalesService(session)
-            lines = [
-                SaleLine(
-                    inventory_item_id=line.inventory_item_id,
-                    quantity=line.quantity,
-                    unit_price=line.unit_price,
-                )
-                for line in result.lines
-            ]
-
-            try:
-                service.update_sale(db_sale, lines)
-                session.commit()
-            except Exception as exc:  # pragma: no cover - UI feedback
-                session.rollback()
-                logger.exception("Failed to update sale")
-                QMessageBox.critical(self,
-                                     "Edit Sale",
-                                     f"Failed to update sale:\n{exc}")
-                return
+        session = self._session
+        db_sale = SalesService(session).get_sale(sale.id)
+        if db_sale is None:
+            session.rollback()
+            QMessageBox.warning(self, "Edit Sale", "Selected sale no longer exists.")
+            return
+
+        dialog = SaleDialog(
+            session=session,
+            parent=self,
+            existing=db_sale,
+            inventory=self._dialog_inventory(),
+        )
+        result = dialog.result_data() if dialog.exec() == SaleDialog.Accepted else None
+        if result is None:
+            # Nothing was changed; release the transaction get_sale opened.
+            session.rollback()
+            return
+
+        db_sale.buyer = result.buyer
+        db_sale.sale_date = result.sale_date
+
+        service = SalesService(session)
+        try:
+            service.update_sale(db_sale, result.lines)
+            session.commit()
+        except Exception as exc:  # pragma: no cover - UI feedback
+            session.rollback()
+            logger.exception("Failed to update sale")
+            QMessageBox.critical(self,
+                                 "Edit Sale",
+                                 f"Failed to update sale:\n{exc}")
+            return
 
         self.refresh()
 
     def _delete_selected(self) -> None:
-        selection = self._current_selection()
-        if selection.count == 0:
+        if self._selected_count() == 0:
             QMessageBox.information(self, "Delete Sales", "No sales selected.")
             return
+        selection = self._current_selection()
 
         confirm = QMessageBox.question(
             self,
@@ -231,26 +341,26 @@ class SalesView(QWidget):
         if confirm != QMessageBox.Yes:
             return
 
-        with session_scope() as session:
-            service = SalesService(session)
-            for sale in selection.rows:
-                db_sale = session.get(Sale, sale.id)
-                if db_sale:
-                    service.delete_sale(db_sale)
-            try:
-                session.commit()
-            except Exception as exc:  # pragma: no cover - UI feedback
-                session.rollback()
-                logger.exception("Failed to delete sales")
-                QMessageBox.critical(self, "Delete Sales", f"Failed to delete sales:\n{exc}")
-                return
+        sale_ids = [sale.id for sale in selection.rows]
+        worker = SessionWorker(
+            lambda session: SalesService(session).delete_sales(sale_ids),
+            self._delete_signals,
+            session_factory=self._session_factory,
+        )
+        QThreadPool.globalInstance().start(worker)
 
-        self.refresh()
+    def _on_delete_failed(self, _token: int, message: str) -> None:
+        QMessageBox.critical(self, "Delete Sales", f"Failed to delete sales:\n{message}")
+
+    def _dialog_inventory(self) -> Optional[List[tuple[int, str, int]]]:
+        # ``None`` makes the dialog query inventory itself; an empty cache only
+        # means "no stock" once a load has actually filled it.
+        return None if self._inventory_stale else self._inventory_cache
+
+    def _selected_count(self) -> int:
+        return len(self._table.selectionModel().selectedRows())
 
     def _current_selection(self) -> SaleSelection:
         selection_model = self._table.selectionModel()
-        selected_rows = selection_model.selectedRows()
-        rows: List[Sale] = []
-        for index in selected_rows:
-            rows.append(self._model.row_at(index.row()))
+        rows = self._model.rows_at(index.row() for index in selection_model.selectedRows())
         return SaleSelection(rows)
\ No newline at end of file
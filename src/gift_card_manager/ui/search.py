@@ -0,0 +1,90 @@
+"""Shared pieces for the searchable table views."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Sequence
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+)
+from PySide6.QtWidgets import QLineEdit
+
+# Role the filter proxies sort on. Models serve values Qt can order natively
+# (numbers, plain strings) here, since it cannot compare ``Decimal``/``date``.
+SORT_ROLE = Qt.UserRole
+
+
+def debounce_search(
+    field: QLineEdit,
+    callback: Callable[[str], None],
+    interval: int = 150,
+) -> QTimer:
+    """Call ``callback(field.text())`` once typing in ``field`` pauses for ``interval`` ms.
+
+    The timer is parented to ``field``, so callers need not keep a reference.
+    """
+
+    timer = QTimer(field)
+    timer.setSingleShot(True)
+    timer.setInterval(interval)
+    timer.timeout.connect(lambda: callback(field.text()))
+    field.textChanged.connect(lambda _text: timer.start())
+    return timer
+
+
+def replace_rows(
+    model: QAbstractTableModel,
+    old_rows: Sequence[Any],
+    new_rows: Sequence[Any],
+    load: Callable[[], None],
+) -> None:
+    """Swap a table model's rows by calling ``load``, notifying views to match.
+
+    When ``new_rows`` holds the same records (by ``id``) in the same order, the
+    model emits ``dataChanged`` instead of resetting, so selection and scroll
+    position, which are tied to row numbers, stay on those records.
+    """
+
+    if new_rows and [row.id for row in new_rows] == [row.id for row in old_rows]:
+        load()
+        model.dataChanged.emit(
+            model.index(0, 0), model.index(len(new_rows) - 1, model.columnCount() - 1)
+        )
+        return
+
+    model.beginResetModel()
+    load()
+    model.endResetModel()
+
+
+class SearchFilterProxy(QSortFilterProxyModel):
+    """Proxy that hides rows not matching the search text and sorts by value.
+
+    Subclasses implement :meth:`_row_matches` against whatever search keys
+    their source model keeps.
+    """
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.setSortRole(SORT_ROLE)
+        self._needle = ""
+
+    def set_needle(self, needle: str) -> None:
+        needle = needle.strip().lower()
+        if needle == self._needle:
+            return
+        self._needle = needle
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:  # noqa: N802
+        if not self._needle:
+            return True
+        return self._row_matches(source_row, self._needle)
+
+    def _row_matches(self, source_row: int, needle: str) -> bool:
+        raise NotImplementedError
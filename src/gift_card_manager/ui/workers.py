@@ -0,0 +1,59 @@
+"""Background helpers for running database work off the GUI thread."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+from sqlalchemy.orm import Session
+
+from ..core import SessionFactory
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerSignals(QObject):
+    """Signals delivered back to the GUI thread by :class:`SessionWorker`.
+
+    Each emission carries the token the worker was started with so a view can
+    discard results from requests it has since superseded.
+    """
+
+    finished = Signal(int, object)
+    failed = Signal(int, str)
+
+
+class SessionWorker(QRunnable):
+    """Run ``fn(session)`` in its own transaction on the global thread pool.
+
+    The session comes from ``session_factory`` and is committed on success,
+    rolled back on error and always closed, like ``session_scope``.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[Session], Any],
+        signals: WorkerSignals,
+        token: int = 0,
+        session_factory: Callable[[], Session] = SessionFactory,
+    ) -> None:
+        super().__init__()
+        self._fn = fn
+        self._signals = signals
+        self._token = token
+        self._session_factory = session_factory
+
+    def run(self) -> None:
+        session = self._session_factory()
+        try:
+            result = self._fn(session)
+            session.commit()
+        except Exception as exc:  # pragma: no cover - reported to the view
+            session.rollback()
+            logger.exception("Background database task failed")
+            self._signals.failed.emit(self._token, str(exc))
+            return
+        finally:
+            session.close()
+        self._signals.finished.emit(self._token, result)
@@ -4,35 +4,73 @@ from __future__ import annotations
 
 from datetime import date
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
-from ..models import GiftCard, Retailer
+from ..models import GiftCard, Retailer, SkuCounter
 
 
 def generate_gift_card_sku(session: Session, retailer: Retailer) -> str:
-    """Generate a unique SKU for a retailer's gift card."""
+    """Generate a unique SKU for a retailer's gift card.
+
+    Sequence numbers come from ``sku_counters``, bumped with a single
+    ``UPDATE ... RETURNING`` so two callers can never be handed the same number.
+    """
 
     date_part = date.today().strftime("%Y%m%d")
     prefix = f"{retailer.code}-{date_part}"
+    sequence = _next_sequence(session, retailer.id, date_part, prefix)
+    return f"{prefix}-{sequence:04d}"
+
+
+def _next_sequence(session: Session, retailer_id: int, date_part: str, prefix: str) -> int:
+    # Cached as lambdas: only the bound retailer/date values change between calls.
+    sequence = session.execute(
+        lambda_stmt(
+            lambda: update(SkuCounter)
+            .where(SkuCounter.retailer_id == retailer_id, SkuCounter.date_part == date_part)
+            .values(last_sequence=SkuCounter.last_sequence + 1)
+            .returning(SkuCounter.last_sequence)
+        ),
+        execution_options={"synchronize_session": False},
+    ).scalar_one_or_none()
+    if sequence is not None:
+        return sequence
 
+    # First SKU of the day for this retailer: continue after any cards issued
+    # before the counter row existed. The upsert still wins races on the seed.
+    seed = _highest_issued_sequence(session, retailer_id, prefix) + 1
+    stmt = sqlite_insert(SkuCounter).values(
+        retailer_id=retailer_id, date_part=date_part, last_sequence=seed
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SkuCounter.retailer_id, SkuCounter.date_part],
+        set_={"last_sequence": SkuCounter.last_sequence + 1},
+    ).returning(SkuCounter.last_sequence)
+    return session.execute(stmt).scalar_one()
+
+
+def _highest_issued_sequence(session: Session, retailer_id: int, prefix: str) -> int:
+    # "<prefix>-" <= sku < "<prefix>." is the same set as LIKE '<prefix>-%' ("." sorts
+    # right after "-"), but unlike LIKE it can walk ix_giftcards_retailer_sku.
+    low, high = f"{prefix}-", f"{prefix}."
     existing = session.execute(
-        select(GiftCard.sku)
-        .where(
-            GiftCard.retailer_id == retailer.id,
-            GiftCard.sku.like(f"{prefix}-%"),
+        lambda_stmt(
+            lambda: select(GiftCard.sku)
+            .where(
+                GiftCard.retailer_id == retailer_id,
+                GiftCard.sku >= low,
+                GiftCard.sku < high,
+            )
+            .order_by(GiftCard.sku.desc())
+            .limit(1)
         )
-        .order_by(GiftCard.sku.desc())
-        .limit(1)
     ).scalar_one_or_none()
 
-    if existing:
-        try:
-            last_number = int(existing.split("-")[-1])
-        except ValueError:
-            last_number = 0
-        sequence = last_number + 1
-    else:
-        sequence = 1
-
-    return f"{prefix}-{sequence:04d}"
\ No newline at end of file
+    if not existing:
+        return 0
+    try:
+        return int(existing.split("-")[-1])
+    except ValueError:
+        return 0
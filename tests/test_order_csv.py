@@ -0,0 +1,169 @@
+"""Tests for order CSV import/export."""
+
+from __future__ import annotations
+
+import csv
+import tempfile
+import unittest
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from gift_card_manager.io.order_csv import (
+    ORDER_CSV_COLUMNS,
+    export_orders_to_csv,
+    import_orders_from_csv,
+)
+from gift_card_manager.models import Order, Retailer
+from gift_card_manager.models.base import Base
+from gift_card_manager.models.enums import OrderStatus, PaymentMethod
+
+
+def _new_session(testcase: unittest.TestCase) -> Session:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    testcase.addCleanup(engine.dispose)
+    session = Session(engine)
+    testcase.addCleanup(session.close)
+    session.add_all([Retailer(code="TGT", name="Target"), Retailer(code="BBY", name="Best Buy")])
+    session.flush()
+    return session
+
+
+def _order_values(session: Session) -> list[tuple]:
+    return [
+        tuple(row)
+        for row in session.execute(
+            select(
+                Retailer.code,
+                Order.order_number,
+                Order.order_date,
+                Order.order_email,
+                Order.payment_method,
+                Order.status,
+                Order.subtotal,
+                Order.tax,
+                Order.shipping,
+                Order.total_cost,
+                Order.credit_card_spend,
+                Order.gift_card_spend,
+            )
+            .join(Retailer, Order.retailer_id == Retailer.id)
+            .order_by(Order.order_number)
+        )
+    ]
+
+
+class OrderCsvTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.session = _new_session(self)
+        retailer_ids = dict(self.session.execute(select(Retailer.code, Retailer.id)).all())
+        self.session.add_all(
+            [
+                Order(
+                    retailer_id=retailer_ids["TGT"],
+                    order_number="T-100",
+                    order_date=date(2026, 3, 1),
+                    order_email="me@example.com",
+                    payment_method=PaymentMethod.MIXED,
+                    status=OrderStatus.SHIPPED,
+                    subtotal=Decimal("90.00"),
+                    tax=Decimal("7.20"),
+                    shipping=Decimal("2.80"),
+                    total_cost=Decimal("100.00"),
+                    credit_card_spend=Decimal("40.00"),
+                    gift_card_spend=Decimal("60.00"),
+                ),
+                Order(
+                    retailer_id=retailer_ids["TGT"],
+                    order_number="T-101",
+                    order_date=date(2026, 3, 2),
+                    payment_method=PaymentMethod.GIFT_CARD,
+                    total_cost=Decimal("25.50"),
+                ),
+                Order(
+                    retailer_id=retailer_ids["BBY"],
+                    order_number="B-200",
+                    order_date=date(2026, 3, 3),
+                    payment_method=PaymentMethod.CREDIT_CARD,
+                    status=OrderStatus.DELIVERED,
+                    total_cost=Decimal("499.99"),
+                ),
+            ]
+        )
+        self.session.commit()
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+    def _write_csv(self, name: str, rows: list[dict[str, str]]) -> Path:
+        path = self.tmp / name
+        with path.open("w", encoding="utf-8", newline="") as stream:
+            writer = csv.DictWriter(stream, fieldnames=ORDER_CSV_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+    def test_export_then_import_round_trips(self) -> None:
+        path = self.tmp / "orders.csv"
+        self.assertEqual(export_orders_to_csv(path, self.session), 3)
+
+        target = _new_session(self)
+        self.assertEqual(import_orders_from_csv(path, target), 3)
+        target.commit()
+
+        self.assertEqual(_order_values(target), _order_values(self.session))
+
+    def test_export_filters_by_retailer_code(self) -> None:
+        path = self.tmp / "target.csv"
+        self.assertEqual(export_orders_to_csv(path, self.session, retailer_code=" tgt "), 2)
+
+        with path.open(encoding="utf-8", newline="") as stream:
+            rows = list(csv.DictReader(stream))
+        self.assertEqual([row["order_number"] for row in rows], ["T-100", "T-101"])
+        self.assertEqual({row["retailer_code"] for row in rows}, {"TGT"})
+
+    def test_import_skips_invalid_rows(self) -> None:
+        valid = {
+            "retailer_code": "bby",
+            "order_number": "B-300",
+            "order_date": "2026-04-01",
+            "payment_method": "credit_card",
+            "total_cost": "12.34",
+        }
+        path = self._write_csv(
+            "mixed.csv",
+            [
+                valid,
+                {**valid, "order_number": "X-1", "retailer_code": "NOPE"},
+                {**valid, "order_number": "X-2", "order_date": "04/01/2026"},
+                {**valid, "order_number": "X-3", "total_cost": ""},
+            ],
+        )
+
+        target = _new_session(self)
+        with self.assertLogs("gift_card_manager.io.order_csv", level="WARNING") as logs:
+            self.assertEqual(import_orders_from_csv(path, target), 1)
+        target.commit()
+
+        self.assertEqual(len(logs.records), 3)
+        order = target.scalars(select(Order)).one()
+        self.assertEqual(order.order_number, "B-300")
+        self.assertEqual(order.total_cost, Decimal("12.34"))
+        self.assertEqual(order.status, OrderStatus.ORDERED)
+        self.assertEqual(order.subtotal, Decimal("0"))
+
+    def test_import_rejects_missing_required_columns(self) -> None:
+        path = self.tmp / "short.csv"
+        path.write_text("retailer_code,order_number\nTGT,T-1\n", encoding="utf-8")
+
+        with self.assertRaises(ValueError):
+            import_orders_from_csv(path, _new_session(self))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""Tests for order deletion and gift card balance restoration."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from gift_card_manager.models import (
+    Attachment,
+    GiftCard,
+    GiftCardUsage,
+    InventoryItem,
+    InventoryMovement,
+    Order,
+    OrderItem,
+    Retailer,
+)
+from gift_card_manager.models.base import Base
+from gift_card_manager.models.enums import GiftCardStatus, InventorySourceType, PaymentMethod
+from gift_card_manager.services import GiftCardAllocation, OrderService
+
+
+class DeleteOrdersTests(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.addCleanup(engine.dispose)
+        self.session = Session(engine)
+        self.addCleanup(self.session.close)
+        self.service = OrderService(self.session)
+
+        self.retailer = Retailer(code="TGT", name="Target")
+        self.session.add(self.retailer)
+        self.session.flush()
+        self.card_a = self._add_card("TGT-20260101-0001", Decimal("50"))
+        self.card_b = self._add_card("TGT-20260101-0002", Decimal("100"))
+
+    def _add_card(self, sku: str, balance: Decimal) -> GiftCard:
+        card = GiftCard(
+            retailer_id=self.retailer.id,
+            sku=sku,
+            card_number=sku,
+            acquisition_cost=balance,
+            face_value=balance,
+            remaining_balance=balance,
+        )
+        self.session.add(card)
+        self.session.flush()
+        return card
+
+    def _add_order(self, number: str, *allocations: tuple[GiftCard, str]) -> Order:
+        order = Order(
+            retailer_id=self.retailer.id,
+            order_number=number,
+            order_date=date(2026, 1, 2),
+            payment_method=PaymentMethod.GIFT_CARD,
+            total_cost=sum((Decimal(amount) for _card, amount in allocations), Decimal("0")),
+        )
+        return self.service.create_order(
+            order,
+            allocations=[
+                GiftCardAllocation(gift_card_id=card.id, amount=Decimal(amount))
+                for card, amount in allocations
+            ],
+        )
+
+    def _count(self, model, *criteria) -> int:
+        return len(self.session.scalars(select(model).where(*criteria)).all())
+
+    def test_restores_balances_and_leaves_no_orphans(self) -> None:
+        deleted = self._add_order("A-1", (self.card_a, "50"), (self.card_b, "30"))
+        also_deleted = self._add_order("A-2", (self.card_b, "20"))
+        kept = self._add_order("B-1", (self.card_b, "10"))
+        self.assertEqual(self.card_a.status, GiftCardStatus.USED)
+
+        item = OrderItem(
+            order_id=deleted.id,
+            item_name="Console",
+            quantity=1,
+            unit_price=Decimal("80"),
+            total_price=Decimal("80"),
+        )
+        stock = InventoryItem(item_name="Console")
+        self.session.add_all(
+            [item, stock, Attachment(order_id=deleted.id, file_path="receipt.pdf")]
+        )
+        self.session.flush()
+        movement = InventoryMovement(
+            inventory_item_id=stock.id,
+            source_type=InventorySourceType.ORDER,
+            order_item_id=item.id,
+            quantity_change=1,
+            cost_change=Decimal("80"),
+        )
+        self.session.add(movement)
+        self.session.commit()
+
+        deleted_ids = [deleted.id, also_deleted.id]
+        self.service.delete_orders(deleted_ids)
+        self.session.commit()
+        self.session.expire_all()
+
+        self.assertEqual(self.card_a.remaining_balance, Decimal("50"))
+        self.assertEqual(self.card_a.status, GiftCardStatus.ACTIVE)
+        self.assertEqual(self.card_b.remaining_balance, Decimal("90"))
+
+        self.assertEqual(self._count(Order, Order.id.in_(deleted_ids)), 0)
+        self.assertEqual(self._count(OrderItem, OrderItem.order_id.in_(deleted_ids)), 0)
+        self.assertEqual(self._count(Attachment, Attachment.order_id.in_(deleted_ids)), 0)
+        self.assertEqual(self._count(GiftCardUsage, GiftCardUsage.order_id.in_(deleted_ids)), 0)
+        self.assertIsNone(movement.order_item_id)
+
+        self.assertEqual(self._count(GiftCardUsage, GiftCardUsage.order_id == kept.id), 1)
+        self.assertIsNotNone(self.session.get(Order, kept.id))
+
+    def test_single_delete_restores_balances_like_bulk_delete(self) -> None:
+        order = self._add_order("A-1", (self.card_a, "50"), (self.card_b, "30"))
+        self.session.commit()
+
+        self.service.delete_order(order)
+        self.session.commit()
+        self.session.expire_all()
+
+        self.assertEqual(self.card_a.remaining_balance, Decimal("50"))
+        self.assertEqual(self.card_a.status, GiftCardStatus.ACTIVE)
+        self.assertEqual(self.card_b.remaining_balance, Decimal("100"))
+        self.assertIsNone(self.session.get(Order, order.id))
+
+    def test_empty_id_list_is_a_no_op(self) -> None:
+        order = self._add_order("A-1", (self.card_a, "20"))
+        self.session.commit()
+
+        self.service.delete_orders([])
+        self.session.commit()
+
+        self.assertIsNotNone(self.session.get(Order, order.id))
+        self.assertEqual(self.card_a.remaining_balance, Decimal("30"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Tests for the sales service."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from gift_card_manager.models import InventoryItem, Sale, SaleItem
+from gift_card_manager.models.base import Base
+from gift_card_manager.services import SaleLine, SalesService
+
+
+class SalesServiceTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.addCleanup(engine.dispose)
+        self.session = Session(engine)
+        self.addCleanup(self.session.close)
+        self.service = SalesService(self.session)
+
+    def _add_item(self, name: str, quantity: int) -> InventoryItem:
+        item = InventoryItem(
+            item_name=name,
+            quantity_on_hand=quantity,
+            average_cost=Decimal("5"),
+            total_cost=Decimal("5") * quantity,
+        )
+        self.session.add(item)
+        self.session.flush()
+        return item
+
+    def _add_sale(
+        self, buyer: str, sale_date: date, *lines: tuple[InventoryItem, int]
+    ) -> Sale:
+        return self.service.create_sale(
+            Sale(buyer=buyer, sale_date=sale_date),
+            [
+                SaleLine(inventory_item_id=item.id, quantity=quantity, unit_price=Decimal("8"))
+                for item, quantity in lines
+            ],
+        )
+
+    def _count(self, model, *criteria) -> int:
+        return len(self.session.scalars(select(model).where(*criteria)).all())
+
+
+class ListSalesPageTests(SalesServiceTestCase):
+    # list_sales_page is built from cached lambdas; these checks make sure each
+    # call binds its own limit, keyset and pattern instead of reusing old ones.
+
+    BUYERS = ("bob", "b_x", "alice", "al% off", "Carol", "BOB_2", "dave", "ella")
+
+    def setUp(self) -> None:
+        super().setUp()
+        # Several sales share a date so paging has to fall back on the id.
+        for index, buyer in enumerate(self.BUYERS * 2):
+            self.session.add(
+                Sale(
+                    buyer=buyer,
+                    sale_date=date(2026, 1, 1 + index % 3),
+                    total_value=Decimal("10"),
+                    total_cost=Decimal("6"),
+                    profit=Decimal("4"),
+                )
+            )
+        self.session.commit()
+        self.expected = [sale.id for sale in self.service.list_sales()]
+
+    def _ids(self, **kwargs) -> list[int]:
+        return [sale.id for sale in self.service.list_sales_page(**kwargs)]
+
+    def test_each_call_uses_its_own_limit(self) -> None:
+        for limit in (3, 5, 3, 1, len(self.expected) + 5):
+            self.assertEqual(self._ids(limit=limit), self.expected[:limit])
+
+    def test_keyset_pages_walk_the_full_listing_in_order(self) -> None:
+        for page_size in (4, 5):
+            seen: list[int] = []
+            after = None
+            while True:
+                page = self.service.list_sales_page(after=after, limit=page_size)
+                if not page:
+                    break
+                seen.extend(sale.id for sale in page)
+                after = (page[-1].sale_date, page[-1].id)
+            self.assertEqual(seen, self.expected)
+
+    def test_buyer_wildcards_match_literally(self) -> None:
+        def buyers(text: str) -> set[str]:
+            return {sale.buyer for sale in self.service.list_sales_page(buyer=text)}
+
+        self.assertEqual(buyers("b_"), {"b_x", "BOB_2"})
+        self.assertEqual(buyers("l%"), {"al% off"})
+        self.assertEqual(buyers("BO"), {"bob", "BOB_2"})
+        self.assertEqual(buyers("b_"), {"b_x", "BOB_2"})
+
+    def test_buyer_filter_pages_with_keyset(self) -> None:
+        expected = [
+            sale.id for sale in self.service.list_sales() if "bo" in sale.buyer.lower()
+        ]
+        first = self.service.list_sales_page(buyer="bo", limit=2)
+        rest = self.service.list_sales_page(
+            buyer="bo", after=(first[-1].sale_date, first[-1].id), limit=10
+        )
+        self.assertEqual([sale.id for sale in first + rest], expected)
+
+
+class DeleteSalesTests(SalesServiceTestCase):
+    def test_restores_stock_and_removes_rows(self) -> None:
+        console = self._add_item("Console", 10)
+        controller = self._add_item("Controller", 10)
+        first = self._add_sale("alice", date(2026, 1, 1), (console, 2), (controller, 3))
+        second = self._add_sale("bob", date(2026, 1, 2), (console, 1))
+        kept = self._add_sale("carol", date(2026, 1, 3), (controller, 4))
+        self.session.commit()
+        self.assertEqual(console.quantity_on_hand, 7)
+        self.assertEqual(controller.quantity_on_hand, 3)
+
+        deleted_ids = [first.id, second.id]
+        self.service.delete_sales(deleted_ids)
+        self.session.commit()
+        self.session.expire_all()
+
+        self.assertEqual(console.quantity_on_hand, 10)
+        self.assertEqual(controller.quantity_on_hand, 6)
+        self.assertEqual(self._count(Sale, Sale.id.in_(deleted_ids)), 0)
+        self.assertEqual(self._count(SaleItem, SaleItem.sale_id.in_(deleted_ids)), 0)
+
+        self.assertIsNotNone(self.session.get(Sale, kept.id))
+        self.assertEqual(self._count(SaleItem, SaleItem.sale_id == kept.id), 1)
+
+    def test_empty_id_list_is_a_no_op(self) -> None:
+        console = self._add_item("Console", 10)
+        sale = self._add_sale("alice", date(2026, 1, 1), (console, 2))
+        self.session.commit()
+
+        self.service.delete_sales([])
+        self.session.commit()
+        self.session.expire_all()
+
+        self.assertIsNotNone(self.session.get(Sale, sale.id))
+        self.assertEqual(console.quantity_on_hand, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Tests for gift card SKU generation."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from gift_card_manager.models import GiftCard, Retailer
+from gift_card_manager.models.base import Base
+from gift_card_manager.utils.sku import generate_gift_card_sku
+
+
+class GenerateGiftCardSkuTests(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.addCleanup(engine.dispose)
+        self.session = Session(engine)
+        self.addCleanup(self.session.close)
+
+        self.retailer = Retailer(code="TGT", name="Target")
+        self.other = Retailer(code="BBY", name="Best Buy")
+        self.session.add_all([self.retailer, self.other])
+        self.session.flush()
+        self.prefix = f"TGT-{date.today():%Y%m%d}"
+
+    def _add_card(self, retailer: Retailer, sku: str) -> None:
+        self.session.add(
+            GiftCard(
+                retailer_id=retailer.id,
+                sku=sku,
+                card_number=sku,
+                acquisition_cost=Decimal("90"),
+                face_value=Decimal("100"),
+                remaining_balance=Decimal("100"),
+            )
+        )
+        self.session.flush()
+
+    def test_first_sku_of_the_day_starts_at_one(self) -> None:
+        self.assertEqual(
+            generate_gift_card_sku(self.session, self.retailer), f"{self.prefix}-0001"
+        )
+
+    def test_continues_after_highest_existing_sequence(self) -> None:
+        self._add_card(self.retailer, f"{self.prefix}-0003")
+        self._add_card(self.retailer, f"{self.prefix}-0007")
+        # Neither another day's nor another retailer's numbers count.
+        self._add_card(self.retailer, "TGT-20000101-0099")
+        self._add_card(self.other, f"BBY-{date.today():%Y%m%d}-0050")
+
+        first = generate_gift_card_sku(self.session, self.retailer)
+        second = generate_gift_card_sku(self.session, self.retailer)
+
+        self.assertEqual(first, f"{self.prefix}-0008")
+        self.assertEqual(second, f"{self.prefix}-0009")
+
+    def test_generated_skus_do_not_collide(self) -> None:
+        self._add_card(self.retailer, f"{self.prefix}-0002")
+
+        skus = []
+        for _ in range(5):
+            sku = generate_gift_card_sku(self.session, self.retailer)
+            # gift_cards.sku is unique, so a repeat would fail this flush.
+            self._add_card(self.retailer, sku)
+            skus.append(sku)
+
+        self.assertEqual(len(set(skus)), len(skus))
+        self.assertEqual(skus[0], f"{self.prefix}-0003")
+
+
+if __name__ == "__main__":
+    unittest.main()